@@ -434,7 +434,11 @@ class LocalWorkspace(Workspace):
 
     def import_stack(self, stack_name: str, state: Deployment) -> None:
         with tempfile.NamedTemporaryFile(mode="w", delete=False) as file:
-            json.dump(state.__dict__, file, indent=4)
+            json.dump(
+                {"version": state.version, "deployment": state.deployment},
+                file,
+                indent=4,
+            )
         self._run_pulumi_cmd_sync(
             ["stack", "import", "--file", file.name, "--stack", stack_name]
         )
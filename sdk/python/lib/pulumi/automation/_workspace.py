@@ -12,103 +12,81 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
+import sys
 from abc import ABC, abstractmethod
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
-from typing import Any, Callable, List, Mapping, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional
 
-from ._config import ConfigMap, ConfigValue
-from ._output import OutputMap
-from ._project_settings import ProjectSettings
-from ._stack_settings import StackSettings
-from ._tag import TagMap
+if TYPE_CHECKING:
+    from ._config import ConfigMap, ConfigValue
+    from ._output import OutputMap
+    from ._project_settings import ProjectSettings
+    from ._stack_settings import StackSettings
+    from ._tag import TagMap
 
 PulumiFn = Callable[[], None]
 
+_EMPTY_ENV_VARS: Mapping[str, str] = MappingProxyType({})
+
+
+# ``eq=False`` keeps the identity-based equality and hashing these classes
+# have always had. ``dataclass`` only accepts ``slots`` from Python 3.10 onwards.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"eq": False}
+if sys.version_info[:2] >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
 
+@dataclass(**_DATACLASS_OPTIONS)
 class StackSummary:
     """A summary of the status of a given stack."""
 
     name: str
     current: bool
-    update_in_progress: Optional[bool]
-    last_update: Optional[datetime]
-    resource_count: Optional[int]
-    url: Optional[str]
-
-    def __init__(
-        self,
-        name: str,
-        current: bool,
-        update_in_progress: Optional[bool] = None,
-        last_update: Optional[datetime] = None,
-        resource_count: Optional[int] = None,
-        url: Optional[str] = None,
-    ) -> None:
-        self.name = name
-        self.current = current
-        self.update_in_progress = update_in_progress
-        self.last_update = last_update
-        self.resource_count = resource_count
-        self.url = url
+    update_in_progress: Optional[bool] = None
+    last_update: Optional[datetime] = None
+    resource_count: Optional[int] = None
+    url: Optional[str] = None
 
 
+@dataclass(**_DATACLASS_OPTIONS)
 class WhoAmIResult:
     """The currently logged-in Pulumi identity."""
 
     user: str
-    url: Optional[str]
-    organizations: Optional[List[str]]
-
-    def __init__(
-        self,
-        user: str,
-        url: Optional[str] = None,
-        organizations: Optional[List[str]] = None,
-    ) -> None:
-        self.user = user
-        self.url = url
-        self.organizations = organizations
+    url: Optional[str] = None
+    organizations: Optional[List[str]] = None
 
 
+@dataclass(**_DATACLASS_OPTIONS)
 class PluginInfo:
     name: str
     kind: str
     size: int
-    last_used_time: datetime
-    install_time: Optional[datetime]
-    version: Optional[str]
+    # The constructor has always taken `last_used_time` but exposed it as `last_used`.
+    last_used_time: InitVar[datetime]
+    last_used: datetime = field(init=False)
+    install_time: Optional[datetime] = None
+    version: Optional[str] = None
 
-    def __init__(
-        self,
-        name: str,
-        kind: str,
-        size: int,
-        last_used_time: datetime,
-        install_time: Optional[datetime] = None,
-        version: Optional[str] = None,
-    ) -> None:
-        self.name = name
-        self.kind = kind
-        self.size = size
-        self.install_time = install_time
+    def __post_init__(self, last_used_time: datetime) -> None:
         self.last_used = last_used_time
-        self.version = version
 
 
+@dataclass(**_DATACLASS_OPTIONS)
 class Deployment:
-    version: Optional[int]
-    deployment: Optional[Mapping[str, Any]]
-
-    def __init__(
-        self,
-        version: Optional[int] = None,
-        deployment: Optional[Mapping[str, Any]] = None,
-    ) -> None:
-        self.version = version
-        self.deployment = deployment
+    version: Optional[int] = None
+    deployment: Optional[Mapping[str, Any]] = None
 
-    def __repr__(self):
-        return f"Deployment(version={self.version!r}, deployment={self.deployment!r})"
+    def __repr__(self) -> str:
+        # The deployment is the full stack state, which can be very large; summarize it instead.
+        deployment = (
+            "None" if self.deployment is None else f"<{len(self.deployment)} keys>"
+        )
+        return f"Deployment(version={self.version!r}, deployment={deployment})"
 
 
 class Workspace(ABC):
@@ -141,7 +119,7 @@ class Workspace(ABC):
     If none is specified, the stack will refer to ProjectSettings for this information.
     """
 
-    env_vars: Mapping[str, str] = {}
+    env_vars: Mapping[str, str] = _EMPTY_ENV_VARS
     """
     Environment values scoped to the current workspace. These will be supplied to every Pulumi command.
     """
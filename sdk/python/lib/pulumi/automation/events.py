@@ -15,6 +15,8 @@
 # NOTE: The classes in this file are intended to align with the serialized
 # JSON types defined and versioned in sdk/go/common/apitype/events.go
 
+from __future__ import annotations
+
 from enum import Enum
 from typing import Optional, List, Mapping, Any, MutableMapping
 from ._representable import _Representable
@@ -1003,7 +1003,10 @@ def translate_output_properties(
         and inspect.isclass(typ)
         and issubclass(typ, Enum)
     ):
-        return typ(output)
+        # Look the member up by value directly, only falling back to the slower `Enum.__call__`
+        # (which handles `_missing_` and raises for unknown values) when there is no match.
+        member = typ._value2member_map_.get(output)  # pylint: disable=protected-access
+        return member if member is not None else typ(output)
 
     if isinstance(output, float) and typ is int:
         return int(output)
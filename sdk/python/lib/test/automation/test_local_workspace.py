@@ -15,6 +15,8 @@
 import json
 import os
 import unittest
+from datetime import datetime
+from unittest import mock
 from semver import VersionInfo
 from typing import List, Optional
 
@@ -25,8 +27,10 @@ from pulumi.automation import (
     create_stack,
     create_or_select_stack,
     CommandError,
+    CommandResult,
     ConfigMap,
     ConfigValue,
+    Deployment,
     EngineEvent,
     InvalidVersionError,
     LocalWorkspace,
@@ -38,6 +42,7 @@ from pulumi.automation import (
     Stack,
     StackSettings,
     StackAlreadyExistsError,
+    WhoAmIResult,
     fully_qualified_stack_name,
 )
 from pulumi.automation._local_workspace import _parse_and_validate_pulumi_version
@@ -902,3 +907,63 @@ def test_config_get_object(mock_config, config_settings):
 
 def test_config_get_float(mock_config, config_settings):
     assert mock_config.get_float("float") == float(config_settings.get("test-config:float"))
+
+def test_deployment_repr():
+    deployment = Deployment(version=3, deployment={"manifest": {}, "resources": []})
+    assert repr(deployment) == "Deployment(version=3, deployment=<2 keys>)"
+    assert repr(Deployment()) == "Deployment(version=None, deployment=None)"
+
+
+def test_plugin_info_construction():
+    last_used = datetime(2023, 11, 1, 12, 30)
+    installed = datetime(2023, 10, 1, 9, 0)
+
+    plugin = PluginInfo("aws", "resource", 1024, last_used, installed, "6.0.0")
+    assert plugin.name == "aws"
+    assert plugin.kind == "resource"
+    assert plugin.size == 1024
+    assert plugin.last_used == last_used
+    assert plugin.install_time == installed
+    assert plugin.version == "6.0.0"
+
+    plugin = PluginInfo(name="aws", kind="resource", size=1024, last_used_time=last_used)
+    assert plugin.last_used == last_used
+    assert plugin.install_time is None
+    assert plugin.version is None
+
+
+def test_summary_positional_construction():
+    last_update = datetime(2023, 11, 1, 12, 30)
+    summary = StackSummary("dev", True, False, last_update, 3, "https://example.com/dev")
+    assert summary.name == "dev"
+    assert summary.current is True
+    assert summary.update_in_progress is False
+    assert summary.last_update == last_update
+    assert summary.resource_count == 3
+    assert summary.url == "https://example.com/dev"
+
+    who_am_i = WhoAmIResult("user", "https://example.com", ["org"])
+    assert who_am_i.user == "user"
+    assert who_am_i.url == "https://example.com"
+    assert who_am_i.organizations == ["org"]
+
+
+def test_import_stack_writes_deployment(tmp_path):
+    state = Deployment(version=3, deployment={"manifest": {}, "resources": []})
+    written = {}
+
+    def run_pulumi_cmd_sync(args, on_output=None):
+        if args == ["version"]:
+            return CommandResult(stdout="v3.90.0", stderr="", code=0)
+        assert args[:2] == ["stack", "import"]
+        with open(args[args.index("--file") + 1], encoding="utf-8") as file:
+            written.update(json.load(file))
+        return CommandResult(stdout="", stderr="", code=0)
+
+    with mock.patch.object(LocalWorkspace, "_run_pulumi_cmd_sync", side_effect=run_pulumi_cmd_sync):
+        ws = LocalWorkspace(work_dir=str(tmp_path))
+        ws.import_stack("dev", state)
+
+    imported = Deployment(**written)
+    assert imported.version == state.version
+    assert imported.deployment == state.deployment
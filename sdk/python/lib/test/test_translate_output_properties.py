@@ -636,6 +636,15 @@ class TranslateOutputPropertiesTests(unittest.TestCase):
         self.assertEqual(result, 0.1)
         self.assertEqual(result, ContainerBrightness.ZERO_POINT_ONE)
 
+    def test_int_enum_from_float(self):
+        result = rpc.translate_output_properties(6.0, translate_output_property, ContainerSize)
+        self.assertIsInstance(result, ContainerSize)
+        self.assertEqual(result, ContainerSize.SIX_INCH)
+
+    def test_unknown_enum_value(self):
+        with self.assertRaises(ValueError):
+            rpc.translate_output_properties("green", translate_output_property, ContainerColor)
+
     def test_translate(self):
         output = {
             "firstArg": "hello",